@@ -69,6 +69,30 @@ winmm = ctypes.WinDLL('winmm')
 
 WaitForSingleObject = kernel32.WaitForSingleObject
 
+# CreateWaitableTimerExW flags. The high resolution timer (Windows 10 1803+) gives ~0.5 ms
+# resolution without raising the global timer period like timeBeginPeriod(1) does.
+CREATE_WAITABLE_TIMER_MANUAL_RESET = 0x00000001
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+
+# timeBeginPeriod raises the global system tick rate, so refcount it at module level:
+# any number of Clock instances share a single begin/end pair.
+_WINTIMER_RES_MS = ctypes.c_uint(1)
+_tbp_refcount = 0
+
+def _time_begin_period():
+    global _tbp_refcount
+    if _tbp_refcount == 0:
+        winmm.timeBeginPeriod(_WINTIMER_RES_MS)
+    _tbp_refcount += 1
+
+def _time_end_period():
+    global _tbp_refcount
+    if _tbp_refcount > 0:
+        _tbp_refcount -= 1
+        if _tbp_refcount == 0:
+            winmm.timeEndPeriod(_WINTIMER_RES_MS)
+
 
 #%%============================================================================
 class Clock:
@@ -89,10 +113,23 @@ class Clock:
     """
     WINTIMER_RES_MS = ctypes.c_uint(1)
 
-    def __init__(self, fps=20, sl0_thresh = int(0.005*1e9)):
+    def __init__(self, fps=20, sl0_thresh = int(0.005*1e9), affinity_mask=None, priority=None):
         self.frame_length = 1/fps
         self.frame_len_ns = int(self.frame_length*1e9)
 
+        # Optionally pin the calling thread to specific CPUs and/or raise its priority to
+        # reduce worst-case jitter from cross-core migration and preemption under load.
+        # THREAD_PRIORITY_TIME_CRITICAL is 15. Avoid a mask containing only CPU 0 - that's
+        # where most housekeeping interrupts land. Previous values restored in shutdown().
+        self._prev_affinity = None
+        self._prev_priority = None
+        if affinity_mask is not None:
+            self._prev_affinity = kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(),
+                                                                 ctypes.c_size_t(affinity_mask))
+        if priority is not None:
+            self._prev_priority = kernel32.GetThreadPriority(kernel32.GetCurrentThread())
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), priority)
+
         # nanosecond threshold to switch from sleep(.001) to sleep(0)
         # increase this above .005 to improve accuracy at the expense of CPU time
         self.sl0_thresh = int(sl0_thresh)
@@ -100,9 +137,6 @@ class Clock:
         # Initialize internal object variables for various timer types.
         self.reset()
 
-        # Enable single millisecond resolution timer
-        winmm.timeBeginPeriod(self.WINTIMER_RES_MS)
-
         # This sets the priority of the process to realtime--the same priority as the mouse pointer.
         # kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 31)
         # This creates a timer. This only needs to be done once.
@@ -115,21 +149,50 @@ class Clock:
         pfnCompletionRoutine = NULL  # this could be a callback function
         fResume = False # wake up if in power convervation mode
 
-        try_hi_res=False
-        if try_hi_res:
-            # this is from the python 3.11 discussion on win8.1+ higher res timers.
-            # I can't get it to work properly - it runs slow.
-            # See https://gist.github.com/ra1nty/90b2162bf9777d9bc0db2ef0e44625b1 for possible ideas to fix...
-            self.otimer = kernel32.CreateWaitableTimerExW(NULL, NULL, 0x00000002, 0x1F0003)
+        # Probe for the high resolution timer (Windows 10 1803+). A NULL handle means
+        # we are on an older system and have to fall back to CreateWaitableTimerW.
+        self.otimer = kernel32.CreateWaitableTimerExW(NULL, NULL,
+                          CREATE_WAITABLE_TIMER_MANUAL_RESET | CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+                          TIMER_ALL_ACCESS)
+        self._hires = bool(self.otimer)
+
+        if self._hires:
             ret = kernel32.SetWaitableTimerEx(self.otimer, ctypes.byref(self.delay), interval, NULL, NULL, NULL, 0)
         else:
             # self.otimer = kernel32.CreateWaitableTimerA(NULL, bManualReset, NULL)
             self.otimer = kernel32.CreateWaitableTimerW(NULL, bManualReset, NULL)  # Using W is better (less variation, less CPU) than A
             ret = kernel32.SetWaitableTimer(self.otimer, ctypes.byref(self.delay), interval, pfnCompletionRoutine, NULL, fResume)
+            # Enable single millisecond resolution timer. Only needed on the fallback path -
+            # this raises the global system tick rate, so skip it when the hi-res timer exists.
+            _time_begin_period()
 
         if ret == 0:
             raise ValueError(f"Could not setup timer function:  {self.otimer}")
 
+        # One-shot timer used by sleep()/sleep_free(). It is programmed with the remaining
+        # time to the next tick on each call so the kernel schedules the wake-up directly
+        # instead of polling time.sleep(0.001) in a Python loop.
+        self.stimer = kernel32.CreateWaitableTimerExW(NULL, NULL,
+                          CREATE_WAITABLE_TIMER_MANUAL_RESET | CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+                          TIMER_ALL_ACCESS)
+        if not self.stimer:
+            self.stimer = kernel32.CreateWaitableTimerW(NULL, bManualReset, NULL)
+
+        # Cache the kernel32 bindings so the hot sleep paths skip the ctypes attribute lookup.
+        # Declaring argtypes/restype once also lets ctypes skip per-call type inference.
+        self._SetWaitableTimer = kernel32.SetWaitableTimer
+        self._SetWaitableTimer.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_longlong), ctypes.c_long,
+                                           ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool]
+        self._SetWaitableTimer.restype = ctypes.c_bool
+        self._WaitForSingleObject = kernel32.WaitForSingleObject
+        self._WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        self._WaitForSingleObject.restype = ctypes.c_ulong
+
+        # Preallocated delay buffer reused by the per-call timer paths so each tick avoids
+        # constructing a fresh c_longlong and CArgObject.
+        self._delay_buf = ctypes.c_longlong(0)
+        self._delay_ref = ctypes.byref(self._delay_buf)
+
 
     @property
     def tick(self):
@@ -144,30 +207,42 @@ class Clock:
     def sleep(self):
         """Sleep until the next tick. sleep is locked to the starting time. """
         r = self.tick + 1
-        while self.tick < r:
-            time.sleep(0.001)
+        delay = (r*self.frame_len_ns + self.start_ns - time.perf_counter_ns())//100
+        if delay > 0:
+            self._delay_buf.value = -delay # delay must be negative in 100 nanosecond intervals
+            self._SetWaitableTimer(self.stimer, self._delay_ref, 0, None, None, False)
+            self._WaitForSingleObject(self.stimer, 0xffffffff)
 
 
     def sleep_free(self):
         """Sleep until the next interval - sleep_free is not locked to a starting tick."""
-        while time.perf_counter_ns() < self.free_tick:
-            time.sleep(0.001)
-        self.free_tick = time.perf_counter_ns() + self.frame_len_ns - 1000000  # int(0.001*1e9) # improve accuracy by account for the last sleep.
+        delay = (self.free_tick - time.perf_counter_ns())//100
+        if delay > 0:
+            self._delay_buf.value = -delay # delay must be negative in 100 nanosecond intervals
+            self._SetWaitableTimer(self.stimer, self._delay_ref, 0, None, None, False)
+            self._WaitForSingleObject(self.stimer, 0xffffffff)
+        self.free_tick = time.perf_counter_ns() + self.frame_len_ns
 
 
     def sleep_ns(self):
-        rt = self.tick+1
-        r = self.subtick
-        tt = r+1
+        # One divmod per iteration gives both tick and subtick from a single QPC read;
+        # going through the tick/subtick properties would cost two reads per pass.
+        start_ns = self.start_ns
+        frame = self.frame_len_ns
+        thr = self.sl0_thresh
+        sleep = time.sleep
+        pcns = time.perf_counter_ns
+        rt = (pcns() - start_ns)//frame + 1
 
         if rt-self.prevtick<2:
-            while tt > r:
-                tr = self.frame_len_ns-tt
-                if tr < self.sl0_thresh:
-                    time.sleep(0)
+            while True:
+                t, r = divmod(pcns() - start_ns, frame)
+                if t >= rt:
+                    break
+                if frame - r < thr:
+                    sleep(0)
                 else:
-                    time.sleep(0.001)
-                tt=self.subtick
+                    sleep(0.001)
         else:
             self.dropped += 1
             # outstr = f' missed {rt-self.prevtick-1} @ {rt}'
@@ -179,18 +254,39 @@ class Clock:
         self.prevtick=rt
 
     def sleep_b(self):
+        """Sleep until the next tick, adapting to the measured scheduler overshoot.
+
+        sleep(0.001) typically oversleeps by a variable amount (0.5-2 ms depending on the
+        scheduler). Track the actual sleep durations with a Welford mean/variance estimate
+        and keep sleeping only while the time remaining exceeds mean+stddev of a real 1 ms
+        sleep; spin out the remainder. This avoids both overshoot and wasted wake-ups.
+        """
         r = self.tick+1
 
         if r-self.prevtick<2:
+            # Hoist everything into locals so each loop iteration is only LOAD_FAST ops
+            # around the sleep/QPC calls; the estimator state is written back once at the end.
+            perf_counter_ns = time.perf_counter_ns
+            sleep = time.sleep
+            mean = self.sleep_mean
+            m2 = self.sleep_m2
+            n = self.sleep_n
+            est = self.sleep_est_ns
             ns_next_tick = r*self.frame_len_ns + self.start_ns
-            tt = time.perf_counter_ns()
-            c_sl10_thresh = ns_next_tick - self.sl0_thresh
+            tt = perf_counter_ns()
+            while ns_next_tick - tt > est:
+                sleep(0.001)
+                t_wake = perf_counter_ns()
+                slept = t_wake - tt
+                n += 1
+                delta = slept - mean
+                mean += delta/n
+                m2 += delta*(slept - mean)
+                est = mean + (m2/n)**0.5
+                tt = t_wake
+            self.sleep_mean, self.sleep_m2, self.sleep_n, self.sleep_est_ns = mean, m2, n, est
             while tt < ns_next_tick:
-                if tt > c_sl10_thresh:
-                    time.sleep(0)
-                else:
-                    time.sleep(0.001)
-                tt=time.perf_counter_ns()
+                tt = perf_counter_ns()
         else:
             self.dropped += 1
             # outstr = f' missed {r-self.prevtick-1} @ {r}'
@@ -204,9 +300,9 @@ class Clock:
 
     def sleep_win_kernel_adj(self):
         """ this uses a delay adjustment that seems to work better than just subticks """
-        delay = ctypes.c_longlong((-(self.frame_len_ns-self.subtick) + self.dly_adj)//100) # delay must be negative in 100 nanosecond intervals
-        ret=kernel32.SetWaitableTimer(self.ktimer, ctypes.byref(delay), 0, ctypes.c_void_p(), ctypes.c_void_p(), False)
-        kernel32.WaitForSingleObject(self.ktimer, 0xffffffff)
+        self._delay_buf.value = (-(self.frame_len_ns-self.subtick) + self.dly_adj)//100 # delay must be negative in 100 nanosecond intervals
+        ret=self._SetWaitableTimer(self.ktimer, self._delay_ref, 0, None, None, False)
+        self._WaitForSingleObject(self.ktimer, 0xffffffff)
 
         # this doesn't really work well
         n=200 # averaging filter for dly_adj
@@ -217,9 +313,9 @@ class Clock:
 
     def sleep_win_kernel_subt(self):
         """ this uses subticks, works ok. """
-        delay = ctypes.c_longlong(-(self.frame_len_ns-self.subtick)//100) # delay must be negative in 100 nanosecond intervals
-        ret=kernel32.SetWaitableTimer(self.ktimer, ctypes.byref(delay), 0, ctypes.c_void_p(), ctypes.c_void_p(), False)
-        kernel32.WaitForSingleObject(self.ktimer, 0xffffffff)
+        self._delay_buf.value = -(self.frame_len_ns-self.subtick)//100 # delay must be negative in 100 nanosecond intervals
+        ret=self._SetWaitableTimer(self.ktimer, self._delay_ref, 0, None, None, False)
+        self._WaitForSingleObject(self.ktimer, 0xffffffff)
 
 
     def sleep_win_kernel_periodic(self):
@@ -233,39 +329,60 @@ class Clock:
         self.dly_adj=0
         self.mytick=0
         self.dropped=0
+        # sleep(0.001) overshoot estimator used by sleep_b (Welford running mean/variance).
+        # The 2 ms starting guess is replaced by the first measured sample.
+        self.sleep_mean=2e6
+        self.sleep_m2=0.0
+        self.sleep_n=0
+        self.sleep_est_ns=2e6
         self.start_ns = time.perf_counter_ns()
         self.err=[]
 
 
     def shutdown(self):
         """Perform shutdown tasks."""
-        winmm.timeEndPeriod(self.WINTIMER_RES_MS)
+        if not self._hires:
+            _time_end_period()
         kernel32.CancelWaitableTimer(self.ktimer)
         kernel32.CancelWaitableTimer(self.otimer)
+        kernel32.CancelWaitableTimer(self.stimer)
+        if self._prev_priority is not None:
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), self._prev_priority)
+        if self._prev_affinity:  # SetThreadAffinityMask returns 0 on failure; don't restore that
+            kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), ctypes.c_size_t(self._prev_affinity))
 
 
-    def test(self,method='sleep',duration=10,duty_loops=50000):
-        """Run a test on the given method for sleep."""
+    def test(self,method='sleep',duration=10,duty_loops=50000,duty_ns=None):
+        """Run a test on the given method for sleep.
+
+        duty_loops is a Python counting loop used as the artificial per-frame workload.
+        Pass duty_ns instead to busy-wait for a fixed wall-clock time per frame, which
+        gives a deterministic duty fraction of frame_length regardless of interpreter
+        speed.
+        """
 
         import math
         import statistics as st
         import psutil
 
         mean_dt=self.frame_length
-        sx,sxx,n,sigma,duty_f = 0,0,0,0,0
+        w_mean,w_m2,n,duty_f = 0.0,0.0,0,0  # Welford accumulators: stable for long runs
         tau = 2  # time const, sec
         alpha = 1-self.frame_length/(tau+self.frame_length)
-        dtvec=[]
-        proc_vec=[]
-
-        m_dict = {'sleep':self.sleep,
-                  'sleep_free':self.sleep_free,
-                  'sleep_ns': self.sleep_ns,
-                  'sleep_b':self.sleep_b,
-                  'sleep_win_kernel_subt':self.sleep_win_kernel_subt,
-                  'sleep_win_kernel_adj':self.sleep_win_kernel_adj,
-                  'sleep_win_kernel_periodic':self.sleep_win_kernel_periodic,}
-        fh = m_dict[method]
+
+        if method not in ('sleep','sleep_free','sleep_ns','sleep_b','sleep_win_kernel_subt',
+                          'sleep_win_kernel_adj','sleep_win_kernel_periodic'):
+            raise KeyError(method)
+        fh = getattr(self, method)
+
+        # Hoist the hot references to locals; the property getters are fetched from the
+        # class so the display line skips the descriptor protocol.
+        pc = time.perf_counter
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        tick_fget = type(self).tick.fget
+        subtick_fget = type(self).subtick.fget
+        pcns = time.perf_counter_ns
 
         print('\n')
         print(fh)
@@ -273,40 +390,58 @@ class Clock:
 
         steps=int(duration/self.frame_length)
 
+        # Preallocate the sample vectors so the timing thread never hits a list
+        # reallocation pause mid-run (those show up as spurious max(dtvec) spikes).
+        dtvec=[0.0]*steps
+        proc_vec=[0.0]*steps
+
 
         fh();  fh()  # Call the function handle twice to get the internal state correct
-        t1=time.perf_counter()
+        t1=pc()
         t0=t1-self.frame_length # properly init t0/t1
         t0a=t0
+        cur_cpu = psutil.cpu_percent()  # prime the sampler; later calls report usage since the previous one
         try:
             for i in range(steps):
-                t1=time.perf_counter()
+                t1=pc()
                 dt=(t1-t0)
                 duty=(t0a-t0)
                 t0=t1
                 n=n+1
-                sx=float(sx)+float(dt)
-                sxx=float(sxx)+float(dt)*float(dt)
+                d = dt - w_mean
+                w_mean += d/n
+                w_m2 += d*(dt - w_mean)
                 mean_dt = mean_dt*alpha + dt*(1-alpha)
                 duty_f = duty_f*alpha + (duty/dt)*(1-alpha)
-                sigma = sigma + (n*dt-sx)**2/(n*(n+1))
-                dtvec.append(dt)
-                proc_vec.append(psutil.cpu_percent())
-                sys.stdout.write(f"\r\r{1/mean_dt:8.4f} Hz; {dt:8.6f}; {mean_dt:8.6f}; {math.sqrt(sigma/(n+1)):8.6f}; {100*duty_f:8.1f}%  {proc_vec[-1]:8.1f}   {self.tick:5d} {self.subtick:7d}  {int(self.dly_adj):7d} ")
-                sys.stdout.flush()
-
-                xx=0
-                for i in range(duty_loops):
-                    xx+=1
+                dtvec[i] = dt
+                if i % 20 == 0:
+                    cur_cpu = psutil.cpu_percent()
+                if i % 10 == 0:
+                    # psutil and the console write each cost a syscall, so keep them off the
+                    # per-tick path where they distort the very timing being measured.
+                    sigma = w_m2/(n-1) if n > 1 else 0.0
+                    write(f"\r\r{1/mean_dt:8.4f} Hz; {dt:8.6f}; {mean_dt:8.6f}; {math.sqrt(sigma):8.6f}; {100*duty_f:8.1f}%  {cur_cpu:8.1f}   {tick_fget(self):5d} {subtick_fget(self):7d}  {int(self.dly_adj):7d} ")
+                    flush()
+                proc_vec[i] = cur_cpu
+
+                if duty_ns is None:
+                    xx=0
+                    for _ in range(duty_loops):  # must not shadow the outer loop index
+                        xx+=1
+                else:
+                    t_end = pcns() + duty_ns
+                    while pcns() < t_end:
+                        pass
 
-                t0a=time.perf_counter()
+                t0a=pc()
 
                 fh() # call the requested sleep function here
 
         except (KeyboardInterrupt):
             print('\nExited Timing loop.')
 
-        dtvec = dtvec[2:] # remove first two, its bad
+        dtvec = dtvec[2:n] # remove first two, its bad; n trims unfilled slots after a Ctrl-C
+        proc_vec = proc_vec[:n]
         rate  = [1/x for x in dtvec]
         print(f"\n    mean: {st.mean(dtvec):8.3g}, std dev: {st.stdev(dtvec):8.5g}, max: {max(dtvec):8.5g}, min:{min(dtvec):8.5g}, processor_load:{st.mean(proc_vec):5.2f}  HZmean={st.mean(rate):6.3f} HZstd={st.stdev(rate):6.3f}")
         print('\n')
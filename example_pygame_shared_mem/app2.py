@@ -18,17 +18,44 @@ import os, sys
 sys.path.insert(0, os.path.join(os.path.abspath(os.path.dirname(__file__)), '..'))
 
 
+import pickle
+
 import pygame
 import simple_pygame_display
 from shared_mem_dict import SharedMemDict
 import yaml
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed, ~10x faster parse
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    print('PyYAML C loader not available; using the slower pure-Python SafeLoader (install libyaml).')
 
 
 cfg_file = 'sim_config_example.yaml'
 
 # Read Configuration Settings ---------------------------------------------------------------------
-with open(cfg_file,'r') as f:
-    cfg_dict = yaml.safe_load(f)
+def load_cfg(path):
+    """Load the YAML config, keeping a pickle sidecar keyed on the file mtime so repeat
+    startups skip the slow YAML parse and just unpickle."""
+    cache_file = path + '.cache.pkl'
+    mtime = os.stat(path).st_mtime_ns
+    try:
+        with open(cache_file,'rb') as f:
+            cached_mtime, cfg = pickle.load(f)
+        if cached_mtime == mtime:
+            return cfg
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    with open(path,'r') as f:
+        cfg = yaml.load(f, Loader=_YamlLoader)
+    try:
+        with open(cache_file,'wb') as f:
+            pickle.dump((mtime, cfg), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass # caching is best-effort; a read-only directory is fine
+    return cfg
+
+cfg_dict = load_cfg(cfg_file)
 
 
 # Init Shared Memory ------------------------------------------------------------------------------
@@ -57,6 +84,47 @@ pause_data=False
 x1=0.
 x2=0.
 x3=0.
+
+# Keypress dispatch table: one O(1) dict lookup per KEYDOWN instead of an if chain.
+def _toggle_pause():
+    global pause_data
+    pause_data = not pause_data
+
+def _reset_xs():
+    global x1,x2,x3
+    x1=0
+    x2=0
+    x3=0
+
+def _toggle_w():
+    global pressed_w
+    pressed_w = not pressed_w
+
+def _quit():
+    print('quitting..')
+    simdsp.running=False  # This is not required, just here as an example
+
+KEY_HANDLERS = {'p': _toggle_pause, 'r': _reset_xs, 'w': _toggle_w, 'q': _quit}
+
+# Resolve the shared-memory indices once: writing through sim_shm.arr skips the
+# per-key dict lookup in SharedMemDict.__setitem__ on every frame.
+sim_arr = sim_shm.arr
+app2_write_plan = [(sim_shm.varnames[k], i % 3) for i,k in enumerate(app2_names)] # (array index, which of x1/x2/x3)
+
+# Precompute the display ordering: testing every shm key against the name lists each
+# frame is O(N*M) with list membership. Also pre-bind the row formatters.
+app1_set = frozenset(app1_names)
+app2_set = frozenset(app2_names)
+app1_display = [(k, sim_shm.varnames[k]) for k in sim_shm.keys() if k in app1_set] # (key, array index)
+app2_display = [(k, sim_shm.varnames[k]) for k in sim_shm.keys() if k in app2_set]
+fmt1 = "app1:  {:>16s} = {:10.2f}".format
+fmt2 = "app2:  {:>16s} = {:10.2f}".format
+
+# Static header text never changes frame to frame, so build the strings once.
+STATIC_HDR = ("Pause My Data:  'p'",
+              "Reset My Data:  'r'",
+              )
+
 while simdsp.loop_controller():
     # this loop will run at 25 FPS
 
@@ -64,20 +132,12 @@ while simdsp.loop_controller():
     for event in simdsp.events: # User did something.
         if event.type == pygame.KEYDOWN: # user pressed a key
             print(f"User pressed {event.unicode}")
-            if event.unicode == 'p':
-                pause_data = not pause_data
-            if event.unicode == 'r':
-                x1=0
-                x2=0
-                x3=0
-            if event.unicode == 'w':
-                pressed_w = not pressed_w
-            if event.unicode=='q':
-                print('quitting..')
-                simdsp.running=False  # This is not required, just here as an example
-
-    simdsp.tprint("Pause My Data:  'p'")
-    simdsp.tprint("Reset My Data:  'r'")
+            handler = KEY_HANDLERS.get(event.unicode)
+            if handler:
+                handler()
+
+    for s in STATIC_HDR:
+        simdsp.tprint(s)
     simdsp.newline()
     simdsp.tprint('App2 counts down for the control items.')
 
@@ -87,24 +147,21 @@ while simdsp.loop_controller():
         x2 = (x2-2.) % 4000
         x3 = (x3-3.) % 15000
 
-    ii=0
-    for k in app2_names:
-        sim_shm[k] = [x1,x2,x3][ii]
-        ii = ( ii+1) %3
-
-    # as an alternative to the dict interface:
-    #     sim_shm.arr[7] will directly set index 7 of the shared array.
+    xs = (x1,x2,x3)
+    for idx, j in app2_write_plan:
+        sim_arr[idx] = xs[j]
 
     simdsp.horz_line(length=150)
-    # Now read and display all shared items
+    # Now read and display all shared items. One C-level snapshot of the whole
+    # array replaces a SharedMemDict.__getitem__ (dict lookup + memoryview index)
+    # per key, and also gives the display a consistent view of the frame.
+    snapshot = sim_arr.tolist()
     simdsp.indent()
-    for k in sim_shm.keys():
-        if k in app1_names:
-            simdsp.tprint(f"app1:  {k:>16s} = {sim_shm[k]:10.2f}")
+    for k, idx in app1_display:
+        simdsp.tprint(fmt1(k, snapshot[idx]))
     simdsp.horz_line(length=150)
-    for k in sim_shm.keys():
-        if k in app2_names:
-            simdsp.tprint(f"app2:  {k:>16s} = {sim_shm[k]:10.2f}")
+    for k, idx in app2_display:
+        simdsp.tprint(fmt2(k, snapshot[idx]))
 
     simdsp.horz_line(length=150)
     simdsp.newline()
@@ -47,14 +47,27 @@ except ImportError:
 
 
 
+import os
 import signal
+import threading
+import time
 
 
 class GracefulExiter():
 
     def __init__(self,use_keyboard_key=None,verbose=False):
         self.reset()
-        signal.signal(signal.SIGINT, self.change_state)
+        self._next_poll = 0.0  # throttles the msvcrt keyboard poll in proceed
+        if hasattr(signal, 'sigwait'):
+            # POSIX: block the signals and consume them synchronously on a dedicated
+            # thread. An async signal handler can fire at arbitrary bytecode boundaries
+            # and only runs when the interpreter next checks for signals, which a long
+            # blocking call in the main thread can delay; sigwait has neither problem.
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+            threading.Thread(target=self._sig_waiter, daemon=True).start()
+        else:
+            # Windows has no sigwait, keep the async handler.
+            signal.signal(signal.SIGINT, self.change_state)
         if use_keyboard_key is not None and msvcrt_avail:
             if len(use_keyboard_key)!=1:
                 raise ValueError('Exit key must be a single character.')
@@ -68,22 +81,39 @@ class GracefulExiter():
             if self.use_keyboard_key is not None:
                 print(f"    or hit '{use_keyboard_key}'")
 
+    def _sig_waiter(self):
+        """Synchronous signal thread (POSIX only)."""
+        sigs = {signal.SIGINT, signal.SIGTERM}
+        signal.sigwait(sigs)
+        print("Exit command received (repeat to exit now).")
+        self._ev.set()
+        signal.sigwait(sigs)
+        os._exit(1)  # second signal exits immediately, matching the SIG_DFL behavior
+
     def change_state(self, signum, frame):
         print("Exit command received (repeat to exit now).")
         signal.signal(signal.SIGINT, signal.SIG_DFL)
-        self.state = True
+        self._ev.set()
 
     def reset(self):
-        self.state = False
+        # A threading.Event is a C-level flag, so the signal thread and the main loop
+        # can read/write it without any GIL-ordering subtleties.
+        self._ev = threading.Event()
 
     def exit_now(self):
-        return self.state
+        return self._ev.is_set()
 
     @property
     def proceed(self):
         if self.use_keyboard_key is not None:
-            self.state = self.state | check_for_key(self.use_keyboard_key)
-        return not self.state
+            # Poll the keyboard at most 50 Hz: a human key-tap doesn't need more, and
+            # this keeps a tight loop from making a kbhit syscall every iteration.
+            now = time.monotonic()
+            if now >= self._next_poll:
+                self._next_poll = now + 0.02
+                if check_for_key(self.use_keyboard_key):
+                    self._ev.set()
+        return not self._ev.is_set()
 
 
 if __name__=="__main__":
@@ -50,6 +50,8 @@ Changelog
 
 
 import ctypes
+import functools
+import time
 import winreg
 from ctypes.wintypes import WORD, UINT, DWORD
 from ctypes.wintypes import WCHAR as TCHAR
@@ -79,6 +81,15 @@ JOY_RETURNCENTERED = 0x400
 JOY_USEDEADZONE = 0x800
 JOY_RETURNALL = JOY_RETURNX | JOY_RETURNY | JOY_RETURNZ | JOY_RETURNR | JOY_RETURNU | JOY_RETURNV | JOY_RETURNPOV | JOY_RETURNBUTTONS
 
+# JOYCAPS.wCaps capability bits
+JOYCAPS_HASZ = 0x1
+JOYCAPS_HASR = 0x2
+JOYCAPS_HASU = 0x4
+JOYCAPS_HASV = 0x8
+JOYCAPS_HASPOV = 0x10
+JOYCAPS_POV4DIR = 0x20
+JOYCAPS_POVCTS = 0x40
+
 
 # Define some structures from WinMM that we will use in function calls.
 class JOYCAPS(ctypes.Structure):
@@ -135,6 +146,44 @@ class JOYINFOEX(ctypes.Structure):
     ]
 
 
+# Declare argument/return types once so ctypes skips per-call type deduction.
+joyGetNumDevs.argtypes = []
+joyGetNumDevs.restype = UINT
+joyGetPos.argtypes = [UINT, ctypes.POINTER(JOYINFO)]
+joyGetPos.restype = UINT
+joyGetPosEx.argtypes = [UINT, ctypes.POINTER(JOYINFOEX)]
+joyGetPosEx.restype = UINT
+joyGetDevCaps.argtypes = [UINT, ctypes.POINTER(JOYCAPS), UINT]
+joyGetDevCaps.restype = UINT
+
+
+@functools.lru_cache(maxsize=16)
+def _get_jsname_from_reg(szRegKey,jsid):
+    """Fetch the name from registry.
+
+    Cached: initialize() re-runs on every probe while no joystick is connected, and
+    the name for a given (szRegKey, jsid) pair never changes, so there is no reason
+    to repeat the four registry syscalls.
+    """
+    js_name = 'unnamed'
+    key = None
+    if len(szRegKey) > 0:
+        try:
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "System\\CurrentControlSet\\Control\\MediaResources\\Joystick\\%s\\CurrentJoystickSettings" % (szRegKey))
+        except WindowsError:
+            key = None
+
+    if key:
+        oem_name = winreg.QueryValueEx(key, "Joystick%dOEMName" % (jsid + 1))
+        if oem_name:
+            key2 = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "System\\CurrentControlSet\\Control\\MediaProperties\\PrivateProperties\\Joystick\\OEM\\%s" % (oem_name[0]))
+            if key2:
+                oem_name = winreg.QueryValueEx(key2, "OEMName")
+                js_name = oem_name[0]
+            key2.Close()
+    return js_name
+
+
 #%%
 class Joystick:
     """Implement a single joystick object."""
@@ -144,12 +193,18 @@ class Joystick:
         self.n_btns = n_btns
         self.n_hats = n_hats
         self.axes = [None]*n_axes
-        self.btns = [None]*n_btns
+        self.btns = [False]*n_btns # updated in place by read_joystick
+        self._btn_masks = tuple(1 << i for i in range(n_btns))
         self.hats = [(None,None)]*n_hats # each hat is two-axis
         self.caps = caps
+        self.caps_mask = caps.wCaps # plain int - tested against JOYCAPS_* bits each read
         self.flags = flags
         self.name = name
+        # axis/button counts are fixed, so the display templates can be built once
+        self._axes_fmt = ', '.join(f"{j}:{{:6.3f}}" for j in range(n_axes))
+        self._btn_lut = ('-','X')
         self.midval = (caps.wXmax-caps.wXmin)//2 # assumes all axes are the same
+        self.inv_mid = 1.0/(self.midval+1.0) # multiply by this instead of dividing in the read loop
         self.freshness = 0
         self.ERROR = True
 
@@ -171,11 +226,14 @@ class Joystick:
 
     def get_axes_str(self,sp=' '):
         """Output a convenient string with joystick axes state."""
+        if sp == ' ':
+            return self._axes_fmt.format(*self.axes) # one precompiled format call
         return f',{sp}'.join([f"{j}:{self.get_axis(j):6.3f}" for j in range(self.n_axes)])
 
     def get_btns_str(self,sp=''):
         """Output a convenient string with joystick button states."""
-        return f"{sp}".join(["X" if b else "-" for b in self.btns])
+        lut = self._btn_lut
+        return f"{sp}".join([lut[b] for b in self.btns])
 
     def __repr__(self):
         return f"Joystick(n_axes={self.n_axes},n_btns={self.n_btns},n_hats={self.n_hats},name='{self.name}',caps={self.caps},flags={self.flags}"
@@ -189,18 +247,22 @@ class JoystickReader:
     # See https://docs.microsoft.com/en-us/previous-versions/dd757112(v=vs.85)
     NUM_JOY_AXES = 6
 
-    hats_4way = {0:    ( 0, 1),
-                 4500: ( 1, 1),
-                 9000: ( 1, 0),
-                 13500:( 1,-1),
-                 18000:( 0,-1),
-                 22500:(-1,-1),
-                 27000:(-1, 0),
-                 31500:(-1, 1),
-                 65535:( 0, 0),
-                 }
+    # 4-way hat octant vectors in dwPOV//4500 order (dwPOV counts in hundredths of a
+    # degree, 4500 per octant); index 8 is centered (dwPOV=65535). Indexing a tuple by
+    # the integer division is cheaper than hashing dwPOV into a dict every poll.
+    hats_4way = (( 0, 1),
+                 ( 1, 1),
+                 ( 1, 0),
+                 ( 1,-1),
+                 ( 0,-1),
+                 (-1,-1),
+                 (-1, 0),
+                 (-1, 1),
+                 ( 0, 0),
+                 )
 
     def __init__(self):
+        self._last_probe_t = -1e9 # let process_joysticks probe immediately
         self.initialize()
 
     def initialize(self):
@@ -212,19 +274,28 @@ class JoystickReader:
         """
         self.stk = {}
         self.info = JOYINFO()
-        self.p_info = ctypes.pointer(self.info)
 
         self.num_js = joyGetNumDevs()
         if self.num_js == 0:
             print("Joystick driver not loaded.")
 
+        misses = 0
         for jsid in range(self.num_js):
-            if joyGetPos(jsid, self.p_info) == JOYERR_NOERROR:
+            if joyGetPos(jsid, ctypes.byref(self.info)) != JOYERR_NOERROR:
+                # joyGetNumDevs reports the driver's maximum id count (often 16), not
+                # how many sticks are plugged in, and each unconnected probe can take
+                # a few ms on some drivers. Real devices sit at low consecutive ids,
+                # so stop after a short streak of empty slots past id 0.
+                misses += 1
+                if misses >= 2 and jsid > 0:
+                    break
+            else:
+                misses = 0
                 caps = JOYCAPS()
-                if joyGetDevCaps(jsid, ctypes.pointer(caps), ctypes.sizeof(JOYCAPS)) != 0:
+                if joyGetDevCaps(jsid, ctypes.byref(caps), ctypes.sizeof(JOYCAPS)) != 0:
                     print(f"Failed to get device {jsid} capabilities.")
                 else:
-                    js_name = self._get_jsname_from_reg(caps.szRegKey,jsid)
+                    js_name = _get_jsname_from_reg(caps.szRegKey,jsid)
                     flags = {k:(1 << i) & caps.wCaps != 0 for i,k in enumerate(['HASZ','HASR','HASU','HASV','HASPOV','POV4dir','POVCTS'])}
                     self.stk[jsid] = Joystick(n_axes=caps.wNumAxes,
                                               n_btns=caps.wNumButtons,
@@ -241,29 +312,10 @@ class JoystickReader:
             #init storage - these are reused across multiple joysticks
             self.info_ex  = JOYINFOEX()
             self.info_ex.dwSize = ctypes.sizeof(JOYINFOEX)
-            self.info_ex.dwFlags = JOY_RETURNBUTTONS | JOY_RETURNCENTERED | JOY_RETURNPOV | JOY_RETURNR | JOY_RETURNU | JOY_RETURNV | JOY_RETURNX | JOY_RETURNY | JOY_RETURNZ
-            self.p_info_ex = ctypes.pointer(self.info_ex)
-
-
-    def _get_jsname_from_reg(self,szRegKey,jsid):
-        """Fetch the name from registry."""
-        js_name = 'unnamed'
-        key = None
-        if len(szRegKey) > 0:
-            try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "System\\CurrentControlSet\\Control\\MediaResources\\Joystick\\%s\\CurrentJoystickSettings" % (szRegKey))
-            except WindowsError:
-                key = None
-
-        if key:
-            oem_name = winreg.QueryValueEx(key, "Joystick%dOEMName" % (jsid + 1))
-            if oem_name:
-                key2 = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "System\\CurrentControlSet\\Control\\MediaProperties\\PrivateProperties\\Joystick\\OEM\\%s" % (oem_name[0]))
-                if key2:
-                    oem_name = winreg.QueryValueEx(key2, "OEMName")
-                    js_name = oem_name[0]
-                key2.Close()
-        return js_name
+            self.info_ex.dwFlags = JOY_RETURNALL | JOY_RETURNCENTERED
+            # byref is a lightweight argument proxy, much cheaper than a full _Pointer
+            # instance; cache it since the same struct is passed on every poll.
+            self.info_ex_ref = ctypes.byref(self.info_ex)
 
 
     def get_count(self):
@@ -283,26 +335,33 @@ class JoystickReader:
     def read_joystick(self,jsid):
         """Read all joystick axes, buttons, and hats."""
         js = self.stk[jsid]
-        flags = js.flags
-        if joyGetPosEx(jsid, self.p_info_ex) == JOYERR_NOERROR:
-
-            if js.n_axes>0: js.axes[0] = (self.info_ex.dwXpos-js.midval)/(js.midval+1.0)
-            if js.n_axes>1: js.axes[1] = (self.info_ex.dwYpos-js.midval)/(js.midval+1.0)
-            if flags['HASZ']: js.axes[2] = (self.info_ex.dwZpos-js.midval)/(js.midval+1.0)
-            if flags['HASR']: js.axes[3] = (self.info_ex.dwRpos-js.midval)/(js.midval+1.0)
-            if flags['HASU']: js.axes[4] = (self.info_ex.dwUpos-js.midval)/(js.midval+1.0)
-            if flags['HASV']: js.axes[5] = (self.info_ex.dwVpos-js.midval)/(js.midval+1.0)
-
-            js.btns = [(1 << i) & self.info_ex.dwButtons != 0 for i in range(js.n_btns)]
-
-            if js.flags['HASPOV']:
-                if js.flags['POVCTS']:
+        caps_mask = js.caps_mask # bit tests on a local int, not dict lookups per flag
+        info = self.info_ex # each ctypes field access builds a new Python int, so touch each field exactly once below
+        if joyGetPosEx(jsid, self.info_ex_ref) == JOYERR_NOERROR:
+
+            midval = js.midval
+            inv_mid = js.inv_mid
+            if js.n_axes>0: js.axes[0] = (info.dwXpos-midval)*inv_mid
+            if js.n_axes>1: js.axes[1] = (info.dwYpos-midval)*inv_mid
+            if caps_mask & JOYCAPS_HASZ: js.axes[2] = (info.dwZpos-midval)*inv_mid
+            if caps_mask & JOYCAPS_HASR: js.axes[3] = (info.dwRpos-midval)*inv_mid
+            if caps_mask & JOYCAPS_HASU: js.axes[4] = (info.dwUpos-midval)*inv_mid
+            if caps_mask & JOYCAPS_HASV: js.axes[5] = (info.dwVpos-midval)*inv_mid
+
+            dwButtons = info.dwButtons # read once, not once per button
+            btns = js.btns # update in place - no fresh list or shifted ints per read
+            for i,mask in enumerate(js._btn_masks):
+                btns[i] = mask & dwButtons != 0
+
+            if caps_mask & JOYCAPS_HASPOV:
+                if caps_mask & JOYCAPS_POVCTS:
                     # continuous hat
                     js.hats[0] = (0,0)
                     raise NotImplementedError('Continuous hat not implemented')
                 else:
-                    # 4-way hat
-                    js.hats[0] = self.hats_4way.get(self.info_ex.dwPOV,(0,0))
+                    # 4-way hat - anything past the last octant (including 65535) is centered
+                    idx = info.dwPOV // 4500
+                    js.hats[0] = self.hats_4way[idx if idx < 8 else 8]
             js.freshness =  (js.freshness + 1) % 256
             js.ERROR=False
         else:
@@ -315,7 +374,12 @@ class JoystickReader:
         # This will only take the first joystick found. If you plan to have multiple joysticks
         # connected, this will need modification.
         if self.get_count()==0:
-            self.initialize() # look for a new joystick -  this can be slow
+            # Probing is slow (WinMM id scan + registry), so while disconnected do it
+            # at most once per second; 1 s of hot-plug latency is acceptable.
+            now = time.monotonic()
+            if now - self._last_probe_t >= 1.0:
+                self._last_probe_t = now
+                self.initialize() # look for a new joystick -  this can be slow
         else:
            for i in self.stk.keys():
                self.read_joystick(i)
@@ -101,7 +101,10 @@ https://stackoverflow.com/questions/43810423/what-is-the-most-efficient-way-to-c
 # import ctypes
 # import numpy as np
 
+import mmap
 import struct
+import sys
+from collections import Counter
 from multiprocessing import shared_memory
 
 dtypes = {'float64':'d',
@@ -119,8 +122,20 @@ dtypes = {'float64':'d',
           'bool':'?',  # '?' is the correct format char
           }
 
+# One compiled Struct per dtype, built at import time: struct.Struct construction
+# parses the format string, so pay that once here rather than in every __init__.
+# No byte-order prefix on purpose - memoryview.cast only accepts native single-char
+# formats, and the standard sizes of '=l'/'=L' would disagree with the cast view on
+# LP64 platforms.
+_STRUCTS = {dt: struct.Struct(code) for dt,code in dtypes.items()}
+
 
 class SharedMemDict():
+    # slots: no per-instance __dict__, and attribute access on the hot paths becomes a
+    # direct slot load
+    __slots__ = ('name','num','dtype','fmt','nbytes','nbytes_req','varnames','shm','arr',
+                 '_S','_raw','_offsets','_unpack_from','_pack_into','_Sall')
+
     def __init__(self,name,num,dtype,reset_shm=False,varnames=[]):
         """Create or connect to a shared memory dict. Values in the dict can be accessed by name or
         by numerical index; the values are all a single data type.
@@ -191,10 +206,15 @@ class SharedMemDict():
 
         self.name = name
         self.num = num
-        self.shape = (self.num,)
         self.dtype = dtype
         self.fmt = dtypes[dtype]
-        self.nbytes = struct.calcsize(self.fmt) * self.num
+        self._S = _STRUCTS[dtype]
+        self.nbytes_req = self._S.size * self.num # bytes actually used by the data
+        # Round the mapping up to a whole page: the kernel hands out page-granular
+        # mappings anyway, and asking for the aligned size keeps create/attach sizes
+        # consistent across platforms that round differently. Unwritten tail pages
+        # cost nothing on Linux.
+        self.nbytes = (self.nbytes_req + mmap.PAGESIZE - 1) & ~(mmap.PAGESIZE - 1)
 
         # if no names for the variables are provided, the index numbers are used
         try:
@@ -207,16 +227,26 @@ class SharedMemDict():
         if len(varnames) != self.num:
             raise ValueError(f"Number of variable names ({len(varnames)}) do not match num given in init call ({num}).")
 
-        if len(varnames) != len(set(varnames)):
-            [varnames.pop(varnames.index(k)) for k in set(varnames)] # pop all names once; leftovers are the duplicates
-            raise ValueError(f"Found repeated variable names: {set(varnames)}")
-
-        self.varnames = {var:i for var,i in zip(varnames,range(num))}
+        # Build the name->index dict in a single pass, catching duplicates as we go
+        # instead of traversing the list again with set(). Interned names let the
+        # per-access dict lookups hit CPython's identity-compare fast path when
+        # callers use literal keys.
+        mapping = {}
+        for i,var in enumerate(varnames):
+            if isinstance(var,str):
+                var = sys.intern(var)
+            if var in mapping:
+                dupes = [k for k,c in Counter(varnames).items() if c > 1] # error path only; caller's list is left alone
+                raise ValueError(f"Found repeated variable names: {dupes}")
+            mapping[var] = i
+        self.varnames = mapping
 
         # create the shared memory
         try:
             self.shm = shared_memory.SharedMemory(name=self.name,create=True,size=self.nbytes)
-            self.shm.buf[:] = bytearray(self.nbytes) # init to zeros if we are creating
+            # No explicit zero-fill needed: a freshly created mapping is already
+            # zero-filled by the OS (ftruncate on POSIX, CreateFileMapping on Windows),
+            # so allocating and copying a transient nbytes bytearray was pure overhead.
         except FileExistsError:
             if reset_shm:
                 print(f'    shm reset: {self.name}')
@@ -227,6 +257,15 @@ class SharedMemDict():
         # Set up a memoryview cast to the correct data type
         self.arr = self.shm.buf.cast(self.fmt)
 
+        # Cached Struct accessors for named access: pack_into/unpack_from on a compiled
+        # Struct are C-implemented and skip the per-element boxing that indexing the
+        # cast memoryview pays, so shm['name'] becomes one dict lookup + one C call.
+        self._raw = self.shm.buf
+        self._offsets = {var: i*self._S.size for var,i in self.varnames.items()}
+        self._unpack_from = self._S.unpack_from
+        self._pack_into = self._S.pack_into
+        self._Sall = struct.Struct(self.fmt*self.num) # whole-buffer Struct for read_all/write_all
+
         # # connect shared memory buffer to a numpy ndarray obj
         # if no_numpy:
         #     self.arr = self.shm.buf.cast('d')
@@ -240,10 +279,10 @@ class SharedMemDict():
         #     self.arr_c = ctypes.cast(self.shm.buf.tobytes(),ctypes.POINTER(ctypes.c_double*self.num))
 
     def __getitem__(self, key):
-        return self.arr[ self.varnames[key] ]
+        return self._unpack_from(self._raw, self._offsets[key])[0]
 
     def __setitem__(self, key, value):
-        self.arr[ self.varnames[key] ] = value
+        self._pack_into(self._raw, self._offsets[key], value)
 
     def __len__(self):
         return self.num
@@ -256,17 +295,87 @@ class SharedMemDict():
         return self.varnames.keys()
 
     def values(self):
-        return [self.arr[i] for i in range(self.num)]  # TODO: why can arr be longer than num?
+        # tolist converts the whole view in one C loop instead of boxing one element
+        # per memoryview index
+        return self.arr[:self.num].tolist()  # arr covers the page-rounded mapping, so it can be longer than num
 
     def items(self):
-        for key in self.keys():
-            yield ( key, self.arr[self.varnames[key]])
+        return zip(self.varnames, self.arr[:self.num].tolist())
 
     def getvar(self,varname):
-        return self.arr[ self.varnames[varname] ]
+        return self._unpack_from(self._raw, self._offsets[varname])[0]
 
     def setvar(self,varname,value):
-        self[varname] = value
+        self._pack_into(self._raw, self._offsets[varname], value)
+
+    def bind(self,varname):
+        """Return a (getter, setter) pair with the name resolved once.
+
+        For code that hits the same variable every iteration of a tight loop, the
+        returned closures skip the per-call dict lookup and attribute loads - each
+        call is a single C-level unpack_from/pack_into:
+
+            get_ab1, set_ab1 = shm.bind('ab1')
+            val = get_ab1()
+            set_ab1(1.125)
+        """
+        off = self._offsets[varname]
+        def get(_u=self._unpack_from, _r=self._raw, _o=off):
+            return _u(_r, _o)[0]
+        def set_(value, _p=self._pack_into, _r=self._raw, _o=off):
+            _p(_r, _o, value)
+        return get, set_
+
+    def as_numpy_view(self):
+        """Return a zero-copy numpy ndarray backed by the shared buffer.
+
+        numpy is imported lazily so the module itself stays dependency free. The
+        returned view is what you want for vectorized math or for passing into
+        compiled kernels (e.g. numba @njit - declare a contiguous signature such as
+        double[::1] so the contiguous layout path is used). Note the dtype comes from
+        the struct format char, so e.g. 'float' means float32 here as documented in
+        the dtypes table.
+        """
+        import numpy as np
+        return np.frombuffer(self.shm.buf, dtype=np.dtype(self.fmt), count=self.num)
+
+    def read_all(self):
+        """Return all values as a list, unpacked from the buffer in one C call."""
+        return list(self._Sall.unpack_from(self._raw, 0))
+
+    def write_all(self,seq):
+        """Write all values from seq (length must equal num) into the buffer in one C call."""
+        self._Sall.pack_into(self._raw, 0, *seq)
+
+    def update(self,values):
+        """Write many values at once.
+
+        values may be a mapping of name->value, or a full-length sequence which is
+        written in a single C call (same as write_all).
+        """
+        if hasattr(values,'items'):
+            pack_into = self._pack_into
+            raw = self._raw
+            offsets = self._offsets
+            for k,v in values.items():
+                pack_into(raw, offsets[k], v)
+        else:
+            self._Sall.pack_into(self._raw, 0, *values)
+
+    def read_into(self,out):
+        """Copy all values into a preallocated writable buffer with one C-level copy.
+
+        out must expose a writable buffer of the same element type holding at least
+        num elements (e.g. array.array(shm.fmt, ...) or a matching numpy ndarray).
+        """
+        mv = memoryview(out).cast('B')
+        mv[:self.nbytes_req] = self._raw[:self.nbytes_req]
+
+    def __reduce__(self):
+        # Pickle as "reconnect by name" so spawn'd child processes attach to the
+        # existing shared memory (the create=False branch) instead of trying to
+        # serialize a memoryview, which would fail.
+        return (self.__class__, (self.name, self.num, self.dtype, False, list(self.varnames)))
 
     def close(self):
         # To prevent a memoryview error message (cannot close exported pointers exist), arr is
@@ -313,10 +422,16 @@ if __name__ == "__main__":
     shm.close()
     shm.unlink()
 
-    # Compare to ShareableList
+    # Compare to ShareableList (clean up afterwards - the segment would otherwise
+    # leak and accumulate across repeated runs)
     shm_list = shared_memory.ShareableList(10*[1.001])
-    # %timeit shm_list[1]
-    # %timeit shm_list[1]=8124.11
+    try:
+        pass
+        # %timeit shm_list[1]
+        # %timeit shm_list[1]=8124.11
+    finally:
+        shm_list.shm.close()
+        shm_list.shm.unlink()
 
 
     # Example 2: Named variables
@@ -78,14 +78,59 @@ FGCOLOR = WHITE
 # This is a simple class that will help us print to the screen.
 class TextPrint(object):
 
+    # fixed attribute layout: skips the per-instance __dict__ and makes the
+    # attribute loads in the per-frame tprint path a little cheaper
+    __slots__ = ('x','y','line_height','font','screen','_cache','_cache_max',
+                 'dirty','_blits','_batch_blit')
+
     def __init__(self,screen,fontname=None,fontsize=11):
         self.reset()
-        self.font = pygame.font.SysFont(fontname,fontsize)
+        # Resolve the font file once and open it directly: SysFont re-runs the system
+        # font enumeration and matching on every construction, while Font(path) just
+        # loads the file. SysFont stays as the fallback since it knows how to pick a
+        # default when the name can't be matched.
+        fontpath = pygame.font.match_font(fontname) if fontname else None
+        if fontpath:
+            self.font = pygame.font.Font(fontpath,fontsize)
+        else:
+            self.font = pygame.font.SysFont(fontname,fontsize)
         self.screen=screen
+        # Rendered-text cache: glyph rasterization dominates tprint cost, and most
+        # lines repeat the same text frame after frame (labels, headers). Keyed on
+        # (text, color) and capped so ever-changing numeric readouts can't grow it
+        # without bound.
+        self._cache = {}
+        self._cache_max = 512
+        # Screen regions touched this frame, consumed by BaseSimpleDisplay's
+        # dirty-rect display update.
+        self.dirty = []
+        # Text blits are batched here and submitted in one call at the end of the
+        # frame (see flush), so N tprints cost one Python->C transition. pygame-ce's
+        # fblits is a leaner blits (positions only, no return list); fall back to
+        # blits(doreturn=0) on upstream pygame.
+        self._blits = []
+        try:
+            self._batch_blit = screen.fblits
+        except AttributeError:
+            self._batch_blit = lambda seq: screen.blits(seq, doreturn=0)
+
+    def _render(self, textString, color):
+        key = (textString, tuple(color))
+        textBitmap = self._cache.get(key)
+        if textBitmap is None:
+            if len(self._cache) >= self._cache_max:
+                self._cache.clear() # crude eviction; only hit when unique strings churn
+            # convert_alpha matches the rendered bitmap to the display format so every
+            # subsequent blit takes SDL's fast path instead of converting on the fly;
+            # the cache means the conversion is paid once per unique string.
+            textBitmap = self.font.render(textString, True, color).convert_alpha()
+            self._cache[key] = textBitmap
+        return textBitmap
 
     def tprint(self, textString, color=FGCOLOR):
-        textBitmap = self.font.render(textString, True, color)
-        self.screen.blit(textBitmap, (self.x, self.y))
+        textBitmap = self._render(textString, color)
+        self._blits.append((textBitmap, (self.x, self.y)))
+        self.dirty.append(pygame.Rect(self.x, self.y, *textBitmap.get_size()))
         self.y += self.line_height
 
     def tprint_xy(self, textString, color=FGCOLOR, x=None, y=None):
@@ -93,17 +138,24 @@ class TextPrint(object):
             x=self.x
         if y is None:
             y=self.y
-        textBitmap = self.font.render(textString, True, color)
-        self.screen.blit(textBitmap, (x, y))
+        textBitmap = self._render(textString, color)
+        self._blits.append((textBitmap, (x, y)))
+        self.dirty.append(pygame.Rect(x, y, *textBitmap.get_size()))
         trect = textBitmap.get_rect()
         return (self.x,self.y,trect.w+self.x,trect.h+self.y)
 
+    def flush(self):
+        """Submit all text queued since the last flush as one batched blit call."""
+        if self._blits:
+            self._batch_blit(self._blits)
+            self._blits.clear()
+
     def newline(self):
         self.y += self.line_height
 
     def horz_line(self,length=10,color=FGCOLOR,width=1):
         # self.y += self.line_height//2
-        pygame.draw.line(self.screen,color,(self.x,self.y),(self.x+length,self.y),1)
+        self.dirty.append(pygame.draw.line(self.screen,color,(self.x,self.y),(self.x+length,self.y),1))
         self.y += self.line_height//2
 
     def reset(self):
@@ -119,11 +171,30 @@ class TextPrint(object):
 
 #%%
 class Button:
-    def __init__(self,screen,gui_font,text,text_pressed,width,height,pos,elevation,is_toggle=False,callback=None):
+
+    # fixed attribute layout, same rationale as TextPrint
+    __slots__ = ('screen','gui_font','_blit_queue','pressed','changed_to_pressed',
+                 'changed_to_unpressed','elevation','dynamic_elecation','original_y_pos',
+                 'callback','_is_toggle','_prev_click','_drawn_state','top_rect',
+                 'top_color','text_pressed','bottom_rect','bottom_color','text',
+                 '_text_cache','text_surf','text_rect','_cached_surf')
+
+    # Parsed once at import: handing pygame.draw.rect a hex string makes SDL re-parse
+    # it into a color on every call.
+    _normal_color  = pygame.Color('#475F77')
+    _hover_color   = pygame.Color('#D74B4B')
+    _pressed_color = pygame.Color('#8a6a00')
+    _shadow_color  = pygame.Color('#354B5E')
+    _text_color    = pygame.Color('#FFFFFF')
+
+    def __init__(self,screen,gui_font,text,text_pressed,width,height,pos,elevation,is_toggle=False,callback=None,blit_queue=None):
         """Implement a simple button (momentary or toggle). Refer to BaseSimpleDisplay.add_button for usage."""
 
         self.screen = screen
         self.gui_font = gui_font
+        # When given, the cached composite joins this shared end-of-frame batch
+        # (see TextPrint.flush) instead of being blitted immediately.
+        self._blit_queue = blit_queue
 
         #Core attributes
         self.pressed = False
@@ -134,15 +205,14 @@ class Button:
         self.original_y_pos = pos[1]
         self.callback = callback
 
-        self._normal_color = '#475F77'
-        self._hover_color = '#D74B4B'
-        self._pressed_color = '#8a6a00'
-        self._shadow_color = '#354B5E'
-
         self._is_toggle = is_toggle
 
         self._prev_click = pygame.mouse.get_pressed()[0]
 
+        # (top_color, dynamic_elecation, text_surf) of the cached composite below;
+        # None forces the first build.
+        self._drawn_state = None
+
         # top rectangle
         self.top_rect = pygame.Rect(pos,(width,height))
         self.top_color = self._normal_color
@@ -151,39 +221,71 @@ class Button:
         self.bottom_rect = pygame.Rect(pos,(width,height))
         self.bottom_color = self._shadow_color
         #text
+        # check_click/check_click_toggle call change_text every frame in their idle
+        # branches, so cache the rendered label surfaces: a button cycles between a
+        # couple of strings and should never rasterize the same one twice.
         self.text = text
-        self.text_surf = gui_font.render(text,True,'#FFFFFF')
-        self.text_rect = self.text_surf.get_rect(center = self.top_rect.center)
+        self._text_cache = {}
+        self.change_text(text)
 
     def change_text(self, newtext):
-        self.text_surf = self.gui_font.render(newtext, True,'#FFFFFF')
+        text_surf = self._text_cache.get(newtext)
+        if text_surf is None:
+            text_surf = self.gui_font.render(newtext, True, self._text_color).convert_alpha()
+            self._text_cache[newtext] = text_surf
+        self.text_surf = text_surf
         self.text_rect = self.text_surf.get_rect(center = self.top_rect.center)
 
-    def draw(self):
+    def draw(self, mouse_pos, mouse_lmb):
 
         if self._is_toggle:
-            self.check_click_toggle()
+            self.check_click_toggle(mouse_pos, mouse_lmb)
         else:
-            self.check_click()
+            self.check_click(mouse_pos, mouse_lmb)
 
         # elevation logic
         self.top_rect.y = self.original_y_pos - self.dynamic_elecation
-        self.text_rect.center = self.top_rect.center
+        # (text_rect no longer needs recentering here: the label is centered inside
+        # the cached composite by _rebuild_surf, which tracks elevation changes)
 
         self.bottom_rect.midtop = self.top_rect.midtop
         self.bottom_rect.height = self.top_rect.height + self.dynamic_elecation
 
-        pygame.draw.rect(self.screen,self.bottom_color, self.bottom_rect,border_radius = 12)
-        pygame.draw.rect(self.screen,self.top_color, self.top_rect,border_radius = 12)
-        self.screen.blit(self.text_surf, self.text_rect)
-
-    def check_click_toggle(self):
+        # The button art is composited into an off-screen surface that is rebuilt only
+        # when something visible changed (color, elevation, label); the common idle
+        # frame costs one cached blit instead of two rect draws plus a text blit.
+        state = (self.top_color, self.dynamic_elecation, self.text_surf)
+        if state != self._drawn_state:
+            self._drawn_state = state
+            self._rebuild_surf()
+        if self._blit_queue is not None:
+            # buttons are queued before any user text, so they keep their place
+            # under the frame's text in the single batched flush
+            self._blit_queue.append((self._cached_surf, (self.top_rect.x, self.original_y_pos - self.elevation)))
+        else:
+            self.screen.blit(self._cached_surf, (self.top_rect.x, self.original_y_pos - self.elevation))
+
+        return self.bottom_rect.union(self.top_rect) # touched region for dirty-rect update
+
+    def _rebuild_surf(self):
+        # The surface is sized for the fully raised button and blitted with its bottom
+        # edge fixed at original_y_pos + height; the press animation just shifts the
+        # art downward inside it, reproducing the on-screen rect geometry of draw().
+        w = self.top_rect.width
+        surf = pygame.Surface((w, self.top_rect.height + self.elevation), pygame.SRCALPHA)
+        top_y = self.elevation - self.dynamic_elecation
+        bottom = pygame.Rect(0, top_y, w, self.top_rect.height + self.dynamic_elecation)
+        top = pygame.Rect(0, top_y, w, self.top_rect.height)
+        pygame.draw.rect(surf,self.bottom_color, bottom,border_radius = 12)
+        pygame.draw.rect(surf,self.top_color, top,border_radius = 12)
+        surf.blit(self.text_surf, self.text_surf.get_rect(center = top.center))
+        self._cached_surf = surf
+
+    def check_click_toggle(self, mouse_pos, mouse_left_click):
         self.changed_to_pressed = False
         self.changed_to_unpressed = False
-        mouse_pos = pygame.mouse.get_pos()
         if self.top_rect.collidepoint(mouse_pos):
             self.top_color = self._hover_color
-            mouse_left_click = pygame.mouse.get_pressed()[0]
             if mouse_left_click:
                 self.dynamic_elecation = 0
                 if not self._prev_click:
@@ -220,13 +322,12 @@ class Button:
                 self.change_text(self.text)
 
 
-    def check_click(self):
+    def check_click(self, mouse_pos, mouse_lmb):
         self.changed_to_pressed = False
         self.changed_to_unpressed = False
-        mouse_pos = pygame.mouse.get_pos()
         if self.top_rect.collidepoint(mouse_pos):
             self.top_color = self._hover_color
-            if pygame.mouse.get_pressed()[0]:
+            if mouse_lmb:
                 self.changed_to_pressed = not self.pressed
                 self.dynamic_elecation = 0
                 self.pressed = True
@@ -266,11 +367,12 @@ class BaseSimpleDisplay:
                  app_size  = (400,400),
                  fontname="Consolas",
                  fontsize=11,
-                 fps_desired = 25.1,
+                 fps_desired = 25,
                  app_icon_filename = None,
                  fg_color = FGCOLOR,
                  bg_color = BGCOLOR,
                  print_status_line = True,
+                 event_types = (pygame.QUIT, pygame.KEYDOWN),
                  ):
 
         self.app_title = app_title
@@ -293,39 +395,65 @@ class BaseSimpleDisplay:
         # Loop until the user clicks the close button.
         self.running = True
 
-        # Used to manage how fast the screen updates.
-        self.clock = pygame.time.Clock()
-        # The pygame.time.Clock.tick() has gotten very inaccurate with the switch from SDL 1.x to 2.X
-        # If timing consistency is important, use this clock regulator. Also see clock in run_at_bottom_of_loop
-        # self.clock = clock.Clock(fps_desired)
-
-
-        # clock.tick operates on integer milliseconds. So, if we request exactly 100 Hz, it will limit
-        # on a msec tick up to, but not including, 10 msec. This results in a minimum frame time of 11 msec
-        # which is 1000/11 = 90.0 Hz. Therefore, to get 100 fps, request just over 100 (such as 100.1) and
-        # the tick will result in a minimum frame time of 10 msec.
-        self.fps_desired = fps_desired+0.1
+        # Frame pacing state. pygame.time.Clock.tick quantizes to integer milliseconds
+        # (and has gotten very inaccurate with the switch from SDL 1.x to 2.x): request
+        # exactly 100 Hz and the minimum frame time becomes 11 msec = 90.9 Hz, which used
+        # to force callers to ask for fps_desired+0.1. The loop is paced instead with a
+        # perf_counter sleep/spin hybrid in run_at_bottom_of_loop, so the requested rate
+        # is hit exactly. For a Windows kernel-timer regulator, see clock.Clock (import
+        # note at the top of this file).
+        self.fps_desired = fps_desired
+        self._period_ns = int(1e9/fps_desired)
+        self._next_tick = time.perf_counter_ns() + self._period_ns
 
         if app_icon_filename is not None:
-            try:
-                icon_filename = os.path.abspath(os.path.join(os.path.dirname(__file__),"simple_pygame_display_assets/piac_icon.png"))
-                with open(icon_filename, 'r') as f:
-                    # doing it this way because passing a filename seems to be problematic for pygame.image.load
-                    programIcon = pygame.image.load(f)
+            icon_filename = os.path.abspath(os.path.join(os.path.dirname(__file__),"simple_pygame_display_assets/piac_icon.png"))
+            if os.path.isfile(icon_filename):
+                programIcon = pygame.image.load(icon_filename)
                 pygame.display.set_icon(programIcon)
-            except FileNotFoundError:
+            else:
                 print(f"Cant find app icon: {icon_filename}")
 
 
         self.n=0
-        self.t0=time.perf_counter()
-        self.t1=self.t0+1.0/fps_desired
+        self.t0=time.perf_counter_ns() # frame timestamps kept in integer ns
+        self.t1=self.t0+int(1e9/fps_desired)
         self.t_proc=0.5*1.0/fps_desired
         self.rate=fps_desired
         self.smoothing_frames = 2
+        self._fps_smoothed_for = 0.0 # forces the EMA coefficient computation on the first frame
+        self._alpha = 1.0
 
         self.buttons = {}
 
+        # Only these event types are retrieved into self.events each frame; everything
+        # else is dropped at the SDL level without building Python event objects. Pass
+        # event_types=None to get the old unfiltered behavior. (Buttons poll the mouse
+        # state directly, so mouse events don't need to come through the queue.)
+        self.event_types = event_types
+        if event_types is not None:
+            # Motion events are the queue's main spam source and are never consumed
+            # here; blocking them at the SDL level means they are never even created,
+            # instead of being built just to be dropped by the clear() below.
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+        # Event pump throttle (ns) - see run_at_top_of_loop.
+        self._last_pump = -1
+        self._min_pump_period = int(0.5e9/fps_desired)
+
+        # Dirty-rect bookkeeping: last frame's touched regions must also be pushed to
+        # the display so content that disappeared gets cleared on screen.
+        self._prev_dirty = []
+        self._full_redraw = True
+
+        # Status-line format cache - see run_at_bottom_of_loop.
+        self._status_key = None
+        self._status_segs = ()
+        # The separator above the status line is a constant 1-px rule; bake it once
+        # so each frame queues a blit instead of calling pygame.draw.line.
+        self._status_sep = pygame.Surface((self.app_width-20, 1)).convert()
+        self._status_sep.fill(self.FGCOLOR)
+
     def loop_controller(self):
         """ I might change this later but this was the easy way to eliminate putting
         run_at_top_of_loop() and run_at_bottom_of_loop in user's GUI code"""
@@ -341,11 +469,36 @@ class BaseSimpleDisplay:
     def run_at_top_of_loop(self):
         self.n+=1
         self.t0=self.t1
-        self.t1=time.perf_counter()
-        self.nsmp=math.ceil(self.smoothing_frames*self.fps_desired) # fps_desired might change, this will behave more consistently than leaving it constant
-        self.rate = (self.rate*(self.nsmp-1) + 1.0/(self.t1-self.t0))/self.nsmp
-
-        self.events = pygame.event.get()
+        self.t1=time.perf_counter_ns()
+        if self.fps_desired != self._fps_smoothed_for:
+            # fps_desired might change at runtime; refresh the smoothing coefficient
+            # when it does instead of redoing the ceil and divides every frame
+            self._fps_smoothed_for = self.fps_desired
+            self.nsmp=math.ceil(self.smoothing_frames*self.fps_desired)
+            self._alpha = 1.0/self.nsmp
+            self._period_ns = int(1e9/self.fps_desired)
+        alpha = self._alpha
+        self.rate = self.rate*(1.0-alpha) + alpha*1e9/(self.t1-self.t0)
+
+        # Query SDL events at most once per frame period. clock.tick below already
+        # clamps the loop, but if the regulator is swapped out (see the clock.Clock
+        # notes) or the loop otherwise spins faster than a frame, this keeps event
+        # retrieval from running thousands of times per second. Half a period of
+        # slack avoids skipping a pump when the loop lands right on the boundary.
+        if self.t1 - self._last_pump >= self._min_pump_period:
+            self._last_pump = self.t1
+            if self.event_types is None:
+                self.events = pygame.event.get()
+            else:
+                # peek first: most frames have nothing of interest pending, and this
+                # skips allocating a fresh empty list just to iterate and discard it
+                if pygame.event.peek(self.event_types):
+                    self.events = pygame.event.get(self.event_types)
+                else:
+                    self.events = ()
+                pygame.event.clear() # discard the unwanted types so the queue can't back up
+        else:
+            self.events = ()
 
         # Get Events
         for event in self.events:
@@ -360,9 +513,13 @@ class BaseSimpleDisplay:
         self.screen.fill(self.BGCOLOR)
         self.textPrint.reset()
 
-        # Update buttons
-        for btn in self.buttons.values():
-            btn.draw()
+        # Update buttons. Snapshot the mouse state once: each check_click* used to
+        # make its own get_pos/get_pressed SDL queries, one pair per button per frame.
+        if self.buttons:
+            mouse_pos = pygame.mouse.get_pos()
+            mouse_lmb = pygame.mouse.get_pressed()[0]
+            for btn in self.buttons.values():
+                self.textPrint.dirty.append(btn.draw(mouse_pos, mouse_lmb))
 
         self.loop_ctrl_flag = True # true so that run_at_bottom_of_loop is called next time.
 
@@ -372,39 +529,80 @@ class BaseSimpleDisplay:
 
         # This is a status printer
         if self.print_status_line:
+            # steady state pays one short-circuited boolean test; the grow branch is
+            # cold and lives in its own method to keep this hot path small
             if self.check_app_height_once and self.textPrint.y+25>self.app_height:
-                self.check_app_height_once = False
-                self.app_height = self.textPrint.y + 25
-                self.app_size = (self.app_width,self.app_height)
-                print(f'increasing app height to: {self.app_height}')
-                print('you should increase your app height in your code to accomodate the status display')
-                self.screen = pygame.display.set_mode(self.app_size)
-
-            # fps = self.clock.get_fps() # not going to use this pygame derived fps anymore
+                self._grow_app_height()
+
             status_line_y = self.app_height-20
-            status_line_len=self.app_width-20
-            pygame.draw.line(self.screen,self.FGCOLOR,(10,status_line_y-5),(10+status_line_len,status_line_y-5),1)
+            tp = self.textPrint
+            tp._blits.append((self._status_sep, (10, status_line_y-5)))
+            tp.dirty.append(pygame.Rect(10, status_line_y-5, self._status_sep.get_width(), 1))
             load_pct = 100*self.fps_desired*self.t_proc
             # self.tprint_xy(f"Update: {self.rate:6.2f} Hz  t_proc={self.t_proc:5.4f} sec ({load_pct:3.0f}%) n={self.n}  ",x=10,y=status_line_y)
-            self.tprint_xy(f"{self.rate:6.2f} Hz | {load_pct:3.0f}% duty ({self.t_proc:5.4f} sec) | n={self.n}  ",x=10,y=status_line_y)
-
-        # update the screen with what we've drawn.
-        pygame.display.flip()
+            # Render the status line in segments: the separator text is static (permanent
+            # cache hits), so only the numeric substrings are re-rendered per frame. The
+            # rate/duty readouts are EMA-smoothed and change their displayed digits far
+            # less often than once per frame, so their strings are reformatted only when
+            # a displayed digit actually changes (cache key rounded to display
+            # precision); the frame counter is the only segment formatted every frame.
+            key = (round(self.rate,2), round(load_pct), round(self.t_proc,4))
+            if key != self._status_key:
+                self._status_key = key
+                self._status_segs = (f"{self.rate:6.2f}", " Hz | ", f"{load_pct:3.0f}", "% duty (", f"{self.t_proc:5.4f}", " sec) | n=")
+            x = 10
+            for s in self._status_segs + (f"{self.n}  ",):
+                surf = tp._render(s, self.FGCOLOR)
+                tp._blits.append((surf, (x, status_line_y)))
+                tp.dirty.append(pygame.Rect(x, status_line_y, *surf.get_size()))
+                x += surf.get_width()
+
+        # Push the frame's batched text to the back buffer in one call.
+        self.textPrint.flush()
+
+        # update the screen with what we've drawn. Only the regions touched this frame
+        # and last frame are pushed to the display; a full flip re-uploads the whole
+        # back buffer every frame under SDL2, so this skips the unchanged parts.
+        dirty = self.textPrint.dirty
+        if self._full_redraw:
+            self._full_redraw = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty + self._prev_dirty)
+        self._prev_dirty = dirty[:]
+        dirty.clear()
 
         # Track processing time
-        self.t_proc = (self.t_proc*(self.nsmp-1) + (time.perf_counter()-self.t1))/self.nsmp
+        self.t_proc = self.t_proc*(1.0-self._alpha) + self._alpha*(time.perf_counter_ns()-self.t1)*1e-9
 
         # self.loop_ctrl_flag = False # false to prevent getting called again before run_at_top_of_loop is called
 
-        # Limit  frames per second.
-        # clock.tick operates on integer milliseconds. So, if we request exactly 100 Hz, it will limit
-        # on a msec tick up to, but not including, 10 msec. This results in a minimum frame time of 11 msec
-        # which is 1000/11 = 90.0 Hz. Therefore, to get 100 fps, request just over 100 (such as 100.1) and
-        # the tick will result in a minimum frame time of 10 msec.
-        self.clock.tick(self.fps_desired)
-        # self.clock.sleep_win_kernel_periodic() # see note above at self.clock
-
-
+        # Limit frames per second: sleep to within ~2 msec of the deadline (time.sleep
+        # is only millisecond-accurate), then spin on perf_counter_ns for the last bit.
+        # This paces the loop at fps_desired without clock.tick's msec quantization.
+        next_tick = self._next_tick
+        rem = next_tick - time.perf_counter_ns()
+        if rem > 2_000_000:
+            time.sleep((rem - 1_000_000)*1e-9)
+        while time.perf_counter_ns() < next_tick:
+            pass
+        next_tick += self._period_ns
+        now = time.perf_counter_ns()
+        if next_tick < now:
+            next_tick = now + self._period_ns # frame overran; resync rather than sprint to catch up
+        self._next_tick = next_tick
+
+
+
+    def _grow_app_height(self):
+        """One-shot: enlarge the window so the status line fits below the user's text."""
+        self.check_app_height_once = False
+        self.app_height = self.textPrint.y + 25
+        self.app_size = (self.app_width,self.app_height)
+        print(f'increasing app height to: {self.app_height}')
+        print('you should increase your app height in your code to accomodate the status display')
+        self.screen = pygame.display.set_mode(self.app_size)
+        self._full_redraw = True # new window surface - push the whole frame once
 
     def close(self):
         """ run this when exiting the app """
@@ -431,10 +629,11 @@ class BaseSimpleDisplay:
         return self.textPrint.y
 
     def draw_rect(self,color,pos,width=0,border_radius=0):
-        pygame.draw.rect(self.screen, pygame.Color(color), pos, width=width,border_radius=border_radius)
+        self.textPrint.dirty.append(pygame.draw.rect(self.screen, pygame.Color(color), pos, width=width,border_radius=border_radius))
 
     def add_button(self,name,text,text_pressed,width,height,pos,elevation,is_toggle=False,callback=None):
-        self.buttons[name] = Button(self.screen,self.textPrint.font,text,text_pressed,width,height,pos,elevation,is_toggle,callback)
+        self.buttons[name] = Button(self.screen,self.textPrint.font,text,text_pressed,width,height,pos,elevation,is_toggle,callback,
+                                    blit_queue=self.textPrint._blits)
 
 
 
@@ -18,6 +18,7 @@ __version__ = '1.0.0'
 
 
 import itertools
+import sys
 
 class Spinner:
 
@@ -42,20 +43,27 @@ class Spinner:
         self.name=name
         self.frames = self.spinners[name]
         self.spinner = itertools.cycle(self.frames)
+        # write() works on the raw byte stream: the frames are UTF-8 encoded once
+        # here instead of TextIOWrapper re-encoding them on every call.
+        self._spinner_b = itertools.cycle([f.encode('utf-8') for f in self.frames])
+        self._last_chars = 0
 
     @property
     def spin(self):
         return next(self.spinner)
 
     def write(self,append_str=''):
-        outstr = f"{spinner.spin}{append_str}"
-        bs = len(outstr)*"\b"+"\b"
-        sys.stdout.write(f"{bs}{outstr}")
-        sys.stdout.flush()
+        # backspace over what the previous call printed (character count, not byte
+        # count - the fancier frames are multi-byte UTF-8 but one column each)
+        out = next(self._spinner_b) + append_str.encode('utf-8')
+        buf = sys.stdout.buffer
+        buf.write(b'\b'*self._last_chars + out)
+        buf.flush()
+        self._last_chars = 1 + len(append_str)
 
 #%%
 if __name__ == "__main__":
-    import sys,time
+    import time
     demo = ['lines','hearts','braille']
 
     print('Ctrl-C to exit loop.')